@@ -5,6 +5,7 @@ from qgis.PyQt.QtWidgets import QAction
 from qgis.PyQt.QtGui import QIcon
 import os.path
 
+from .modules import SettingsManager, TranslationService
 from .modules.ui import CleanDataDialog
 
 class CleanData:
@@ -19,6 +20,11 @@ class CleanData:
 
     def initGui(self):
         """Create the menu entries and toolbar icons inside the QGIS GUI."""
+        # Store first-run defaults, then warm the settings cache so later
+        # lookups skip QSettings entirely
+        SettingsManager.seed_defaults()
+        SettingsManager.prefetch()
+        
         icon = QIcon(os.path.join(self.plugin_dir, 'icon.png'))
         action = QAction(icon, 'Clean Data', self.iface.mainWindow())
         action.triggered.connect(self.run)
@@ -34,8 +40,18 @@ class CleanData:
             self.iface.removePluginMenu(self.menu, action)
             self.iface.removeToolBarIcon(action)
         self.actions = []
+        
+        if self.dialog is not None:
+            self.dialog.translation_manager.close()
+            self.dialog = None
+        
+        # Release the shared translation cache file
+        TranslationService.close_cache()
 
     def run(self):
         """Run method that performs all the real work"""
+        # Release the previous dialog's translation connections
+        if self.dialog is not None:
+            self.dialog.translation_manager.close()
         self.dialog = CleanDataDialog(self.iface)
         self.dialog.show()
@@ -3,21 +3,118 @@ Cleaning module for the Clean Data QGIS plugin.
 Handles all data cleaning functionality.
 """
 
-from qgis.core import QgsVectorLayer, QgsMessageLog, Qgis, QgsField, QgsFeature
-from PyQt5.QtCore import QVariant
-from PyQt5.QtCore import QByteArray
+import re
+from datetime import datetime
+from fractions import Fraction
+from functools import lru_cache
+
+from qgis.core import QgsVectorLayer, QgsMessageLog, Qgis, QgsField, QgsFeatureRequest
+from PyQt5.QtCore import QVariant, QByteArray
+
+# RE2 matches in linear time and cannot backtrack catastrophically, which
+# matters when a user pattern runs over millions of rows. It is optional.
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+
+# Constructs RE2 reads differently from re: $ before a trailing newline,
+# Unicode-aware \d \w \s \b classes, \Z, inline flags, {,n} repeats and
+# POSIX classes. Patterns using them run under re, which the UI validated.
+_RE2_DIFFERS = re.compile(r'\$|\\[dDwWsSbBZ]|\(\?[aiLmsux-]|\{,|\[:')
+
+
+def _compile_pattern(pattern):
+    """Compile a user pattern with RE2 when it means the same there, else with re"""
+    if re2 is not None and not _RE2_DIFFERS.search(pattern):
+        try:
+            return re2.compile(pattern)
+        except Exception:
+            # Constructs such as backreferences and lookarounds need re
+            pass
+    return re.compile(pattern)
+
+
+# Number of pending attribute changes written per edit command
+WRITE_CHUNK_SIZE = 50000
+
+# Default for arguments where None is itself a meaningful value
+_UNSET = object()
+
+
+# Value ranges enforced for the bounded GeoPackage integer types
+INTEGER_RANGES = {
+    'SMALLINT': (-32768, 32767),
+    'MEDIUMINT': (-8388608, 8388607),
+    'TINYINT': (-128, 127),
+}
+
+
+def _build_converter(column_type):
+    """Return a callable converting a text value to column_type, or None for TEXT"""
+    column_type = column_type.upper()
+    
+    if column_type in ['INTEGER', 'INT', 'SMALLINT', 'MEDIUMINT', 'TINYINT']:
+        bounds = INTEGER_RANGES.get(column_type)
+        if bounds is None:
+            return int
+        low, high = bounds
+        
+        def convert_bounded_int(value):
+            value = int(value)
+            if not (low <= value <= high):
+                raise ValueError(f"Value out of range for {column_type}")
+            return value
+        return convert_bounded_int
+    elif column_type in ['DOUBLE', 'FLOAT', 'REAL']:
+        return float
+    elif column_type == 'BOOLEAN':
+        return lambda value: value.lower() in ['true', '1', 't', 'yes', 'y']
+    elif column_type == 'DATE':
+        return lambda value: datetime.strptime(value, '%Y-%m-%d').date()
+    elif column_type == 'DATETIME':
+        return lambda value: datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
+    elif column_type == 'BLOB':
+        return lambda value: QByteArray(value.encode())
+    # TEXT type needs no conversion
+    return None
+
+
+def _nulls_needed(threshold, total_features):
+    """Smallest null count that reaches threshold percent of total_features"""
+    # Exact ceiling of threshold * total_features / 100. The UI passes the
+    # threshold as a float, so it is read back from its decimal text: float
+    # math rounds e.g. 16.1% of 1000 up to 162
+    threshold = Fraction(str(threshold))
+    return int(-(-threshold * total_features // 100))
+
+
+def _null_checker(specific_value=None):
+    """Return a predicate telling whether an attribute value counts as null"""
+    null_values = [None, "", QVariant()]
+    if specific_value is None:
+        return lambda value: value in null_values
+    # Values of any field type are compared by their text, as typed by the user
+    return lambda value: value in null_values or str(value) == specific_value
+
+
+def _ensure_editing(layer):
+    """Put the layer in edit mode if it is not already"""
+    if not layer.isEditable():
+        layer.startEditing()
 
 class ColumnCleaner:
     """Handles column-level cleaning operations"""
     
     @staticmethod
-    def remove_empty_columns(layer):
+    def remove_empty_columns(layer, *, assume_editing=False):
         """Remove columns that contain only null or empty values"""
         if not isinstance(layer, QgsVectorLayer):
             return False
             
-        if not layer.isEditable():
-            layer.startEditing()
+        if not assume_editing:
+            _ensure_editing(layer)
         
         provider = layer.dataProvider()
         fields = provider.fields()
@@ -29,21 +126,25 @@ class ColumnCleaner:
             Qgis.Info
         )
         
-        for field in fields:
-            field_name = field.name()
-            all_null = True
-            
-            for feature in layer.getFeatures():
-                value = feature[field_name]
-                if value not in [None, "", QVariant()]:
-                    all_null = False
-                    break
-            
-            if all_null:
-                columns_to_delete.append(field_name)
+        indices = []
+        layer_fields = layer.fields()
+        for idx, field in enumerate(fields):
+            # Ask the layer rather than the provider so values still in the
+            # edit buffer count; without pending edits the layer passes this
+            # to the provider (an index or a SELECT DISTINCT for GPKG/PostGIS)
+            # instead of scanning features. NULL and "" are the only empty
+            # values, so three distinct values are enough to prove the column
+            # has real content.
+            layer_idx = layer_fields.indexFromName(field.name())
+            if layer_idx < 0:
+                # Already deleted in the edit buffer
+                continue
+            uniques = layer.uniqueValues(layer_idx, 3)
+            if all(value in [None, "", QVariant()] for value in uniques):
+                columns_to_delete.append(field.name())
+                indices.append(idx)
         
         if columns_to_delete:
-            indices = [fields.indexFromName(col) for col in columns_to_delete]
             provider.deleteAttributes(indices)
             layer.updateFields()
             QgsMessageLog.logMessage(
@@ -61,15 +162,20 @@ class ColumnCleaner:
             return False
 
     @staticmethod
-    def remove_columns_with_null_percentage(layer, field_name, threshold=100):
-        """Remove columns based on null percentage threshold"""
+    def remove_columns_with_null_percentage(layer, field_name, threshold=100, specific_value=None, *,
+                                            assume_editing=False):
+        """Remove columns based on null percentage threshold
+        
+        specific_value, when given, is counted as null along with NULL and "".
+        """
         if not isinstance(layer, QgsVectorLayer):
             return False
             
-        if not layer.isEditable():
-            layer.startEditing()
+        if not assume_editing:
+            _ensure_editing(layer)
             
-        if field_name not in [field.name() for field in layer.fields()]:
+        field_names = {field.name(): i for i, field in enumerate(layer.fields())}
+        if field_name not in field_names:
             raise ValueError(f"Field '{field_name}' not found in layer")
             
         total_features = layer.featureCount()
@@ -77,33 +183,113 @@ class ColumnCleaner:
             return False
             
         null_count = 0
-        field_idx = layer.fields().indexFromName(field_name)
+        field_idx = field_names[field_name]
         
-        for feature in layer.getFeatures():
-            value = feature[field_idx]
-            if value in [None, "", QVariant()]:
-                null_count += 1
-                
-        null_percentage = (null_count / total_features) * 100
+        # Stop scanning as soon as the outcome is decided: either enough nulls
+        # were seen to reach the threshold, or the remaining features can no
+        # longer get there
+        needed = _nulls_needed(threshold, total_features)
+        seen = 0
+        if needed > 0:
+            is_null = _null_checker(specific_value)
+            request = QgsFeatureRequest()
+            request.setFlags(QgsFeatureRequest.NoGeometry)
+            request.setSubsetOfAttributes([field_idx])
+            for feature in layer.getFeatures(request):
+                value = feature.attributes()[field_idx]
+                seen += 1
+                if is_null(value):
+                    null_count += 1
+                    if null_count >= needed:
+                        break
+                elif total_features - seen + null_count < needed:
+                    break
+                    
+        # Percentage over the scanned features only; exact if nothing was skipped
+        null_percentage = (null_count / seen) * 100 if seen else 0.0
         
-        if null_percentage >= threshold:
+        if null_count >= needed:
             provider = layer.dataProvider()
             provider.deleteAttributes([field_idx])
             layer.updateFields()
             QgsMessageLog.logMessage(
-                f"Removed field {field_name} with {null_percentage:.1f}% null values", 
+                f"Removed field {field_name} (null values reached the {threshold}% threshold "
+                f"after scanning {seen}/{total_features} features)", 
                 'Clean Data', 
                 Qgis.Success
             )
             return True
             
         QgsMessageLog.logMessage(
-            f"Field {field_name} has {null_percentage:.1f}% null values (below threshold of {threshold}%)", 
+            f"Field {field_name} has {null_percentage:.1f}% null values in {seen}/{total_features} "
+            f"scanned features (below threshold of {threshold}%)", 
             'Clean Data', 
             Qgis.Info
         )
         return False
 
+    @staticmethod
+    def remove_columns_with_null_percentage_batch(layer, field_names, threshold=100,
+                                                 specific_value=None, *, assume_editing=False):
+        """Remove every listed column whose null percentage reaches the threshold.
+        
+        All columns are counted in a single pass over the features and the
+        matching ones are deleted in one provider call.
+        """
+        if not isinstance(layer, QgsVectorLayer):
+            return False
+            
+        if not assume_editing:
+            _ensure_editing(layer)
+            
+        fields = layer.fields()
+        layer_field_names = {field.name(): i for i, field in enumerate(fields)}
+        missing = [name for name in field_names if name not in layer_field_names]
+        if missing:
+            raise ValueError(f"Fields not found in layer: {missing}")
+            
+        total_features = layer.featureCount()
+        if total_features == 0 or not field_names:
+            return False
+            
+        indices = [layer_field_names[name] for name in field_names]
+        null_counts = [0] * len(indices)
+        
+        request = QgsFeatureRequest()
+        request.setFlags(QgsFeatureRequest.NoGeometry)
+        request.setSubsetOfAttributes(indices)
+        is_null = _null_checker(specific_value)
+        positions = list(enumerate(indices))
+        for feature in layer.getFeatures(request):
+            attributes = feature.attributes()
+            for k, idx in positions:
+                if is_null(attributes[idx]):
+                    null_counts[k] += 1
+                    
+        to_delete = []
+        needed = _nulls_needed(threshold, total_features)
+        for name, idx, null_count in zip(field_names, indices, null_counts):
+            if null_count >= needed:
+                to_delete.append((name, idx))
+                
+        if not to_delete:
+            QgsMessageLog.logMessage(
+                f"No fields reached the null threshold of {threshold}%", 
+                'Clean Data', 
+                Qgis.Info
+            )
+            return False
+            
+        provider = layer.dataProvider()
+        provider.deleteAttributes([idx for _, idx in to_delete])
+        layer.updateFields()
+        QgsMessageLog.logMessage(
+            f"Removed fields with at least {threshold}% null values: {[name for name, _ in to_delete]}", 
+            'Clean Data', 
+            Qgis.Success
+        )
+        return True
+
 class ValueCleaner:
     """Handles value-level cleaning operations"""
     
@@ -111,44 +297,99 @@ class ValueCleaner:
     def find_and_replace_values(source_layer, source_field, ref_layer=None, find_field=None, 
                               replace_field=None, pattern_match=False, custom_pattern=None,
                               strip_zeros=False, pad_zeros=False, pad_length=8,
-                              create_new_column=False, new_column_name=None, new_column_type='TEXT'):
-        """Find and replace values in a field"""
+                              create_new_column=False, new_column_name=None, new_column_type='TEXT', *,
+                              assume_editing=False, commit_chunks=False, find_values=None,
+                              replace_value=_UNSET):
+        """Find and replace values in a field.
+        
+        Without a reference layer, find_values (a single value or an iterable
+        of values) limits the replacement to matching source values, which are
+        all set to replace_value. replace_value is required with find_values;
+        it may be an empty string, or None to set NULL.
+        
+        Features are read lazily and replacements are written in chunks of
+        WRITE_CHUNK_SIZE features, each as its own edit command. Uncommitted
+        edits still build up for the whole layer unless commit_chunks is set,
+        which commits every chunk so the edit buffer stays bounded on very
+        large layers. Committed chunks cannot be rolled back, so clean_layer,
+        which rolls back the whole batch on failure, never sets it.
+        """
         if not source_layer or not source_field:
             return 0
             
+        if find_values is not None and not (ref_layer and find_field and replace_field):
+            if replace_value is _UNSET:
+                raise ValueError("find_values requires a replace_value")
+                
         # Start editing if not already
-        if not source_layer.isEditable():
-            source_layer.startEditing()
+        if not assume_editing:
+            _ensure_editing(source_layer)
+            
+        field_names = {field.name(): i for i, field in enumerate(source_layer.fields())}
+        if source_field not in field_names:
+            raise ValueError(f"Field '{source_field}' not found in layer")
+        field_idx = field_names[source_field]
             
+        # Build the matcher once for reference and source values
+        find_match = None
+        if pattern_match and custom_pattern:
+            if re.escape(custom_pattern) == custom_pattern:
+                # No metacharacters: a plain substring test finds the same match
+                def find_substring(value):
+                    return custom_pattern if custom_pattern in value else None
+                find_match = find_substring
+            else:
+                try:
+                    pattern = _compile_pattern(custom_pattern)
+                except re.error:
+                    QgsMessageLog.logMessage(f"Invalid pattern: {custom_pattern}", "Clean Data", Qgis.Warning)
+                    return 0
+                    
+                def find_pattern(value):
+                    match = pattern.search(value)
+                    return match.group() if match else None
+                find_match = find_pattern
+                
         # Create lookup table from reference layer if provided
         lookup = {}
+        allow_blank = False
         if ref_layer and find_field and replace_field:
+            ref_field_names = {field.name(): i for i, field in enumerate(ref_layer.fields())}
+            find_idx = ref_field_names[find_field]
+            replace_idx = ref_field_names[replace_field]
             for feature in ref_layer.getFeatures():
-                find_value = str(feature[find_field])
-                replace_value = str(feature[replace_field])
+                find_value = str(feature[find_idx])
+                replacement = str(feature[replace_idx])
                 
                 # Handle pattern matching in reference values
-                if pattern_match and custom_pattern:
-                    try:
-                        import re
-                        pattern = re.compile(custom_pattern)
-                        match = pattern.search(find_value)
-                        if match:
-                            find_value = match.group()
-                    except re.error:
-                        QgsMessageLog.logMessage(f"Invalid pattern: {custom_pattern}", "Clean Data", Qgis.Warning)
-                        return 0
+                if find_match:
+                    found = find_match(find_value)
+                    if found is not None:
+                        find_value = found
                         
                 # Handle zero stripping in reference values
                 if strip_zeros:
                     find_value = find_value.lstrip('0')
                     
-                lookup[find_value] = replace_value
+                lookup[find_value] = replacement
                 
             QgsMessageLog.logMessage(f"Lookup table created with {len(lookup)} entries: {str(dict(list(lookup.items())[:10]))}", "Clean Data", Qgis.Info)
             
+        # Plain value replacement: every value in the find set maps to one
+        # replacement, which may deliberately blank the matched values
+        elif find_values is not None:
+            allow_blank = True
+            # Source values are compared as text, so find values are too
+            find_set = frozenset(value if isinstance(value, str) else str(value)
+                                 for value in ([find_values] if isinstance(find_values, str)
+                                               else find_values))
+            if strip_zeros:
+                find_set = frozenset(value.lstrip('0') for value in find_set)
+            lookup = dict.fromkeys(find_set, replace_value)
+            
+        use_lookup = bool(ref_layer) or find_values is not None
+        
         # Create new field if requested
-        field_idx = source_layer.fields().indexFromName(source_field)
         if create_new_column:
             # Use provided name or generate one
             new_name = new_column_name or f"{source_field}_new"
@@ -181,27 +422,45 @@ class ValueCleaner:
             source_layer.updateFields()
             new_field_idx = source_layer.fields().indexFromName(new_name)
             
-        # Process features
+        # Read the source column in a single pass, without geometry
+        request = QgsFeatureRequest()
+        request.setFlags(QgsFeatureRequest.NoGeometry)
+        request.setSubsetOfAttributes([field_idx])
+        
+        # Process values, collecting changes to write back a chunk at a time
         count = 0
-        features = source_layer.getFeatures()
-        total_features = source_layer.featureCount()
+        total_features = 0
+        target_idx = new_field_idx if create_new_column else field_idx
+        changes = {}
+        
+        def flush_changes():
+            """Write pending replacements as one edit command, committing it if requested"""
+            change_value = source_layer.changeAttributeValue
+            source_layer.beginEditCommand("Find and replace values")
+            for fid, new_value in changes.items():
+                change_value(fid, target_idx, new_value)
+            source_layer.endEditCommand()
+            changes.clear()
+            if commit_chunks:
+                if not source_layer.commitChanges() or not source_layer.startEditing():
+                    raise ValueError("Failed to commit changes to layer")
         
-        for feature in features:
-            value = str(feature[source_field])
-            original_value = value
+        convert = _build_converter(new_column_type) if create_new_column else None
+        
+        # Source columns repeat values heavily (IDs, codes, classes), so the
+        # transform runs once per distinct value and is reused for the rest
+        @lru_cache(maxsize=None)
+        def transform(original_value):
+            """Return (matched, new_value) for a raw source value"""
+            value = original_value
             matched = False
             
             # Handle pattern matching in source values
-            if pattern_match and custom_pattern:
-                try:
-                    import re
-                    pattern = re.compile(custom_pattern)
-                    match = pattern.search(value)
-                    if match:
-                        value = match.group()
-                        matched = True
-                except re.error:
-                    continue
+            if find_match:
+                found = find_match(value)
+                if found is not None:
+                    value = found
+                    matched = True
                     
             # Handle zero stripping in source values
             if strip_zeros:
@@ -211,10 +470,11 @@ class ValueCleaner:
                 
             # Look up replacement value
             new_value = None
-            if value in lookup:
+            in_lookup = value in lookup
+            if in_lookup:
                 new_value = lookup[value]
                 matched = True
-            elif not ref_layer:  # If no reference layer, just use the matched pattern
+            elif not use_lookup:  # If no reference layer, just use the matched pattern
                 new_value = value
                 matched = True
                 
@@ -229,48 +489,44 @@ class ValueCleaner:
                     # If not a number, skip padding
                     pass
                     
-            if matched and new_value:
-                QgsMessageLog.logMessage(f"Matched: {original_value} -> {value} (stripped) -> {new_value}", "Clean Data", Qgis.Info)
-                
-                # Convert value based on target field type
-                if create_new_column:
-                    try:
-                        new_column_type = new_column_type.upper()
-                        if new_column_type in ['INTEGER', 'INT', 'SMALLINT', 'MEDIUMINT', 'TINYINT']:
-                            new_value = int(new_value)
-                            # Check range limits
-                            if new_column_type == 'SMALLINT' and not (-32768 <= new_value <= 32767):
-                                raise ValueError("Value out of range for SMALLINT")
-                            elif new_column_type == 'MEDIUMINT' and not (-8388608 <= new_value <= 8388607):
-                                raise ValueError("Value out of range for MEDIUMINT")
-                            elif new_column_type == 'TINYINT' and not (-128 <= new_value <= 127):
-                                raise ValueError("Value out of range for TINYINT")
-                        elif new_column_type in ['DOUBLE', 'FLOAT', 'REAL']:
-                            new_value = float(new_value)
-                        elif new_column_type == 'BOOLEAN':
-                            new_value = new_value.lower() in ['true', '1', 't', 'yes', 'y']
-                        elif new_column_type == 'DATE':
-                            from datetime import datetime
-                            new_value = datetime.strptime(new_value, '%Y-%m-%d').date()
-                        elif new_column_type == 'DATETIME':
-                            from datetime import datetime
-                            new_value = datetime.strptime(new_value, '%Y-%m-%d %H:%M:%S')
-                        elif new_column_type == 'BLOB':
-                            new_value = QByteArray(new_value.encode())
-                        # TEXT type needs no conversion
-                    except (ValueError, TypeError) as e:
-                        QgsMessageLog.logMessage(f"Warning: Could not convert '{new_value}' to {new_column_type}: {str(e)}", "Clean Data", Qgis.Warning)
-                        continue
-                
-                # Update the value
-                if create_new_column:
-                    source_layer.changeAttributeValue(feature.id(), new_field_idx, new_value)
-                else:
-                    source_layer.changeAttributeValue(feature.id(), field_idx, new_value)
-                count += 1
-            else:
+            # A blank replacement is only written for values found in the
+            # lookup; a pattern match outside find_values is left untouched
+            if not matched or not (new_value or (allow_blank and in_lookup)):
                 QgsMessageLog.logMessage(f"No match found for: {original_value} -> {value} (stripped)", "Clean Data", Qgis.Warning)
+                return False, None
                 
+            QgsMessageLog.logMessage(f"Matched: {original_value} -> {value} (stripped) -> {new_value}", "Clean Data", Qgis.Info)
+            
+            # Convert value based on target field type
+            if convert and new_value is not None:
+                try:
+                    new_value = convert(new_value)
+                except (ValueError, TypeError) as e:
+                    QgsMessageLog.logMessage(f"Warning: Could not convert '{new_value}' to {new_column_type.upper()}: {str(e)}", "Clean Data", Qgis.Warning)
+                    return False, None
+                    
+            return True, new_value
+            
+        # Hot loop: everything it touches is a local. The iterator reads from
+        # a snapshot, so flushing edits part way through is safe.
+        for feature in source_layer.getFeatures(request):
+            total_features += 1
+            raw_value = feature.attributes()[field_idx]
+            # NULLs never produce a replacement
+            if raw_value is None or (isinstance(raw_value, QVariant) and raw_value.isNull()):
+                continue
+            matched, new_value = transform(raw_value if isinstance(raw_value, str) else str(raw_value))
+            if matched:
+                changes[feature.id()] = new_value
+                count += 1
+                if len(changes) >= WRITE_CHUNK_SIZE:
+                    flush_changes()
+                    
+        transform.cache_clear()
+        
+        if changes:
+            flush_changes()
+            
         QgsMessageLog.logMessage(f"Replaced {count} values out of {total_features} features", "Clean Data", Qgis.Info)
         return count
 
@@ -281,40 +537,63 @@ class CleaningManager:
         self.column_cleaner = ColumnCleaner()
         self.value_cleaner = ValueCleaner()
     
-    def remove_empty_columns(self, layer):
+    def remove_empty_columns(self, layer, *, assume_editing=False):
         """Remove columns that contain only null or empty values"""
-        return self.column_cleaner.remove_empty_columns(layer)
+        return self.column_cleaner.remove_empty_columns(layer, assume_editing=assume_editing)
         
-    def remove_columns_with_null_percentage(self, layer, field_name, threshold=100):
+    def remove_columns_with_null_percentage(self, layer, field_name, threshold=100, specific_value=None, *,
+                                            assume_editing=False):
         """Remove columns based on null percentage threshold"""
-        return self.column_cleaner.remove_columns_with_null_percentage(layer, field_name, threshold)
+        return self.column_cleaner.remove_columns_with_null_percentage(layer, field_name, threshold, specific_value,
+                                                                      assume_editing=assume_editing)
+        
+    def remove_columns_with_null_percentage_batch(self, layer, field_names, threshold=100, specific_value=None, *,
+                                                  assume_editing=False):
+        """Remove columns based on null percentage threshold, scanning the layer once"""
+        return self.column_cleaner.remove_columns_with_null_percentage_batch(layer, field_names, threshold,
+                                                                            specific_value,
+                                                                            assume_editing=assume_editing)
         
     def find_and_replace_values(self, layer, source_field, ref_layer=None, find_field=None, replace_field=None,
                                pattern_match=False, custom_pattern=None, strip_zeros=False, pad_zeros=False, pad_length=8,
-                               create_new_column=False, new_column_name=None, new_column_type='TEXT'):
+                               create_new_column=False, new_column_name=None, new_column_type='TEXT', *,
+                               assume_editing=False, commit_chunks=False, find_values=None,
+                               replace_value=_UNSET):
         """Find and replace values in a field"""
         return self.value_cleaner.find_and_replace_values(layer, source_field, ref_layer, find_field, replace_field,
                                                          pattern_match, custom_pattern, strip_zeros, pad_zeros, pad_length,
-                                                         create_new_column, new_column_name, new_column_type)
+                                                         create_new_column, new_column_name, new_column_type,
+                                                         assume_editing=assume_editing, commit_chunks=commit_chunks,
+                                                         find_values=find_values, replace_value=replace_value)
     
     def clean_layer(self, layer, operations):
         """Apply multiple cleaning operations to a layer"""
         if not isinstance(layer, QgsVectorLayer):
             return False
             
-        if not layer.isEditable():
-            layer.startEditing()
+        # Start editing once; the individual operations below assume it
+        _ensure_editing(layer)
             
         success = True
         for operation in operations:
             try:
                 if operation['type'] == 'remove_empty_columns':
-                    success &= self.remove_empty_columns(layer)
+                    success &= self.remove_empty_columns(layer, assume_editing=True)
                 elif operation['type'] == 'remove_null_columns':
                     success &= self.remove_columns_with_null_percentage(
                         layer,
                         operation['field'],
-                        operation.get('threshold', 100)
+                        operation.get('threshold', 100),
+                        operation.get('specific_value'),
+                        assume_editing=True
+                    )
+                elif operation['type'] == 'remove_null_columns_batch':
+                    success &= self.remove_columns_with_null_percentage_batch(
+                        layer,
+                        operation['fields'],
+                        operation.get('threshold', 100),
+                        operation.get('specific_value'),
+                        assume_editing=True
                     )
                 elif operation['type'] == 'find_replace':
                     count = self.find_and_replace_values(
@@ -330,7 +609,10 @@ class CleaningManager:
                         operation.get('pad_length', 8),
                         operation.get('create_new_column', False),
                         operation.get('new_column_name'),
-                        operation.get('new_column_type', 'TEXT')
+                        operation.get('new_column_type', 'TEXT'),
+                        assume_editing=True,
+                        find_values=operation.get('find_values'),
+                        replace_value=operation.get('replace_value', _UNSET)
                     )
                     success &= count > 0
             except Exception as e:
@@ -3,168 +3,267 @@ Settings manager module for the Clean Data QGIS plugin.
 Handles all settings and configuration.
 """
 
-from qgis.core import QgsSettings
+from functools import wraps
+
+
+# Default Templates
+_DEFAULT_SINGLE_TRANSLATION_PROMPT = (
+    "Translate the following text to {target_lang}:\n"
+    "Text: {text}\n"
+    "Rules:\n"
+    "1. Maintain the original meaning and style\n"
+    "2. Return ONLY the translation, no explanations\n"
+    "3. Keep any special characters or formatting"
+)
+
+_DEFAULT_BATCH_TRANSLATION_PROMPT = (
+    "Translate the following {batch_size} texts to {target_lang}:\n"
+    "{texts}\n"
+    "Rules:\n"
+    "1. Maintain the original meaning and style\n"
+    "2. Return translations as a numbered list, one per line\n"
+    "3. Keep any special characters or formatting\n"
+    "4. Return EXACTLY {batch_size} translations"
+)
+
+
+def _memoized(getter):
+    """Cache a zero-argument getter's result until the next settings write"""
+    name = getter.__name__
+    
+    @wraps(getter)
+    def wrapper(cls):
+        if name not in cls._memo:
+            cls._memo[name] = getter(cls)
+        return cls._memo[name]
+    return wrapper
 
 class SettingsManager:
     """Manages plugin settings and configuration"""
     
     SETTINGS_PREFIX = "CleanData/"
     
-    # Default Templates
-    DEFAULT_SINGLE_TRANSLATION_PROMPT = (
-        "Translate the following text to {target_lang}:\n"
-        "Text: {text}\n"
-        "Rules:\n"
-        "1. Maintain the original meaning and style\n"
-        "2. Return ONLY the translation, no explanations\n"
-        "3. Keep any special characters or formatting"
-    )
-
-    DEFAULT_BATCH_TRANSLATION_PROMPT = (
-        "Translate the following {batch_size} texts to {target_lang}:\n"
-        "{texts}\n"
-        "Rules:\n"
-        "1. Maintain the original meaning and style\n"
-        "2. Return translations as a numbered list, one per line\n"
-        "3. Keep any special characters or formatting\n"
-        "4. Return EXACTLY {batch_size} translations"
-    )
-
-    @classmethod
-    def get_setting(cls, key, default=None):
-        """Get a setting value"""
-        settings = QgsSettings()
-        full_key = cls.SETTINGS_PREFIX + key
-        return settings.value(full_key, default)
+    # Shared QgsSettings instance, created on first use
+    _settings = None
     
-    @classmethod
-    def set_setting(cls, key, value):
-        """Set a setting value"""
-        settings = QgsSettings()
-        full_key = cls.SETTINGS_PREFIX + key
-        settings.setValue(full_key, value)
-    
-    # API Keys
-    @classmethod
-    def get_google_api_key(cls):
-        """Get Google Translate API key"""
-        return cls.get_setting("google_api_key")
+    # Read-through cache of raw stored values keyed by full settings key.
+    # QSettings always goes to its persistent store, so repeated reads of
+    # the same key are served from here instead.
+    _cache = {}
     
-    @classmethod
-    def set_google_api_key(cls, key):
-        """Set Google Translate API key"""
-        cls.set_setting("google_api_key", key)
+    # Whether the cache holds every stored key (see prefetch)
+    _prefetched = False
     
-    @classmethod
-    def get_ollama_url(cls):
-        """Get Ollama API URL"""
-        return cls.get_setting("ollama_url", "http://localhost:11434")
+    # Results of the zero-argument getters, cleared on any write
+    _memo = {}
     
-    @classmethod
-    def set_ollama_url(cls, url):
-        """Set Ollama API URL"""
-        cls.set_setting("ollama_url", url)
+    # Known settings: name -> (default, description). Plain get_<name> and
+    # set_<name> accessors are generated from this table below the class.
+    _KEYS = {
+        # API Keys
+        "google_api_key": (None, "Google Translate API key"),
+        "ollama_url": ("http://localhost:11434", "Ollama API URL"),
+        "openai_api_key": (None, "OpenAI API key"),
+        "deepseek_api_key": (None, "DeepSeek API key"),
+        # Model Settings
+        "ollama_model": ("aya", "Ollama model name"),
+        "openai_model": ("gpt-3.5-turbo", "OpenAI model name"),
+        "deepseek_model": ("deepseek-chat", "DeepSeek model name"),
+        # Prompt Templates
+        "translation_prompt": (_DEFAULT_SINGLE_TRANSLATION_PROMPT,
+                               "translation prompt template for single translations"),
+        "batch_translation_prompt": (_DEFAULT_BATCH_TRANSLATION_PROMPT,
+                                     "translation prompt template for batch translations"),
+        # Batch and Cache Settings (typed accessors are defined on the class)
+        "batch_size": (10, "translation batch size"),
+        "ollama_parallel": (4, "most simultaneous Ollama requests per translation"),
+        "translation_cache_days": (90, "number of days cached translations are kept"),
+    }
     
-    @classmethod
-    def get_openai_api_key(cls):
-        """Get OpenAI API key"""
-        return cls.get_setting("openai_api_key")
+    # Known settings whose defaults are never written by seed_defaults
+    _UNSEEDED = frozenset(("translation_prompt", "batch_translation_prompt"))
     
-    @classmethod
-    def set_openai_api_key(cls, key):
-        """Set OpenAI API key"""
-        cls.set_setting("openai_api_key", key)
+    # Full settings keys for the known names, built once instead of on
+    # every get/set
+    _FULL = dict(zip(_KEYS, map(SETTINGS_PREFIX.__add__, _KEYS)))
     
+    # Default Templates (kept on the class for existing callers)
+    DEFAULT_SINGLE_TRANSLATION_PROMPT = _DEFAULT_SINGLE_TRANSLATION_PROMPT
+    DEFAULT_BATCH_TRANSLATION_PROMPT = _DEFAULT_BATCH_TRANSLATION_PROMPT
+
     @classmethod
-    def get_deepseek_api_key(cls):
-        """Get DeepSeek API key"""
-        return cls.get_setting("deepseek_api_key")
+    def _get_qsettings(cls):
+        """Get the shared QgsSettings instance"""
+        if cls._settings is None:
+            # Imported on first use to keep plugin import light at startup
+            from qgis.core import QgsSettings
+            cls._settings = QgsSettings()
+        return cls._settings
     
     @classmethod
-    def set_deepseek_api_key(cls, key):
-        """Set DeepSeek API key"""
-        cls.set_setting("deepseek_api_key", key)
+    def get_setting(cls, key, default=None):
+        """Get a setting value"""
+        full_key = cls._FULL.get(key) or cls.SETTINGS_PREFIX + key
+        if full_key not in cls._cache:
+            cls._cache[full_key] = cls._get_qsettings().value(full_key, None)
+        value = cls._cache[full_key]
+        if value is None:
+            # Unseeded known keys still get their table default
+            return default if default is not None else cls._KEYS.get(key, (None,))[0]
+        return value
     
-    # Model Settings
     @classmethod
-    def get_ollama_model(cls):
-        """Get Ollama model name"""
-        return cls.get_setting("ollama_model", "aya")
+    def set_setting(cls, key, value):
+        """Set a setting value"""
+        full_key = cls._FULL.get(key) or cls.SETTINGS_PREFIX + key
+        settings = cls._get_qsettings()
+        # Only touch the persistent store when the value really changes;
+        # a write may flush to disk or the registry
+        if full_key not in cls._cache:
+            cls._cache[full_key] = settings.value(full_key, None)
+        if cls._cache[full_key] == value:
+            return
+        settings.setValue(full_key, value)
+        cls._cache[full_key] = value
+        cls._memo.clear()
     
     @classmethod
-    def set_ollama_model(cls, model):
-        """Set Ollama model name"""
-        cls.set_setting("ollama_model", model)
+    def set_many(cls, updates):
+        """Set several settings at once under a single settings group"""
+        settings = cls._get_qsettings()
+        changed = False
+        settings.beginGroup(cls.SETTINGS_PREFIX)
+        for key, value in updates.items():
+            full_key = cls._FULL.get(key) or cls.SETTINGS_PREFIX + key
+            if full_key not in cls._cache:
+                cls._cache[full_key] = settings.value(key, None)
+            if cls._cache[full_key] == value:
+                continue
+            settings.setValue(key, value)
+            cls._cache[full_key] = value
+            changed = True
+        settings.endGroup()
+        
+        if changed:
+            settings.sync()
+            cls._memo.clear()
     
     @classmethod
-    def get_openai_model(cls):
-        """Get OpenAI model name"""
-        return cls.get_setting("openai_model", "gpt-3.5-turbo")
+    def get(cls, name):
+        """Get a known setting by name, with its default applied"""
+        if name not in cls._KEYS:
+            raise KeyError(f"Unknown setting: {name}")
+        return getattr(cls, f"get_{name}")()
     
     @classmethod
-    def set_openai_model(cls, model):
-        """Set OpenAI model name"""
-        cls.set_setting("openai_model", model)
+    def set(cls, name, value):
+        """Set a known setting by name"""
+        if name not in cls._KEYS:
+            raise KeyError(f"Unknown setting: {name}")
+        getattr(cls, f"set_{name}")(value)
     
+    # Batch Settings
     @classmethod
-    def get_deepseek_model(cls):
-        """Get DeepSeek model name"""
-        return cls.get_setting("deepseek_model", "deepseek-chat")
+    @_memoized
+    def get_batch_size(cls):
+        """Get translation batch size"""
+        # Stored values can come back as strings; the memo keeps the int
+        return int(cls.get_setting("batch_size"))
     
     @classmethod
-    def set_deepseek_model(cls, model):
-        """Set DeepSeek model name"""
-        cls.set_setting("deepseek_model", model)
+    def set_batch_size(cls, size):
+        """Set translation batch size"""
+        size = int(size)
+        cls.set_setting("batch_size", size)
+        cls._memo["get_batch_size"] = size
     
-    # Prompt Templates
     @classmethod
-    def get_translation_prompt(cls):
-        """Get translation prompt template for single translations"""
-        default_prompt = cls.DEFAULT_SINGLE_TRANSLATION_PROMPT
-        return cls.get_setting("translation_prompt", default_prompt)
+    @_memoized
+    def get_ollama_parallel(cls):
+        """Get the most simultaneous Ollama requests per translation"""
+        return max(1, int(cls.get_setting("ollama_parallel")))
     
     @classmethod
-    def get_batch_translation_prompt(cls):
-        """Get translation prompt template for batch translations"""
-        default_prompt = cls.DEFAULT_BATCH_TRANSLATION_PROMPT
-        return cls.get_setting("batch_translation_prompt", default_prompt)
+    def set_ollama_parallel(cls, count):
+        """Set the most simultaneous Ollama requests per translation"""
+        count = int(count)
+        cls.set_setting("ollama_parallel", count)
+        cls._memo["get_ollama_parallel"] = max(1, count)
     
     @classmethod
-    def set_translation_prompt(cls, prompt):
-        """Set translation prompt template for single translations"""
-        cls.set_setting("translation_prompt", prompt)
+    @_memoized
+    def get_translation_cache_days(cls):
+        """Get number of days cached translations are kept"""
+        return max(1, int(cls.get_setting("translation_cache_days")))
     
     @classmethod
-    def set_batch_translation_prompt(cls, prompt):
-        """Set translation prompt template for batch translations"""
-        cls.set_setting("batch_translation_prompt", prompt)
+    def set_translation_cache_days(cls, days):
+        """Set number of days cached translations are kept"""
+        days = int(days)
+        cls.set_setting("translation_cache_days", days)
+        cls._memo["get_translation_cache_days"] = max(1, days)
     
-    # Batch Settings
     @classmethod
-    def get_batch_size(cls):
-        """Get translation batch size"""
-        return int(cls.get_setting("batch_size", 10))
+    def prefetch(cls):
+        """Load every stored plugin setting into the read cache in one pass"""
+        settings = cls._get_qsettings()
+        settings.beginGroup(cls.SETTINGS_PREFIX)
+        for key in settings.childKeys():
+            cls._cache[cls.SETTINGS_PREFIX + key] = settings.value(key)
+        settings.endGroup()
+        cls._prefetched = True
     
     @classmethod
-    def set_batch_size(cls, size):
-        """Set translation batch size"""
-        cls.set_setting("batch_size", int(size))
+    def seed_defaults(cls):
+        """Store the table defaults for any known setting not saved yet"""
+        settings = cls._get_qsettings()
+        for name, (default, _) in cls._KEYS.items():
+            # Prompt templates stay unseeded so edits to the built-in
+            # defaults still reach users who never customised them
+            if default is None or name in cls._UNSEEDED:
+                continue
+            full_key = cls._FULL[name]
+            if not settings.contains(full_key):
+                settings.setValue(full_key, default)
+                cls._cache[full_key] = default
     
     @classmethod
     def get_all_settings(cls):
         """Get all plugin settings"""
-        settings = QgsSettings()
-        all_settings = {}
-        settings.beginGroup(cls.SETTINGS_PREFIX)
-        for key in settings.childKeys():
-            all_settings[key] = settings.value(key)
-        settings.endGroup()
-        return all_settings
+        # Served from the cache; the settings tree is only walked once
+        if not cls._prefetched:
+            cls.prefetch()
+        prefix_len = len(cls.SETTINGS_PREFIX)
+        return {key[prefix_len:]: value for key, value in cls._cache.items()
+                if value is not None}
     
     @classmethod
     def clear_all_settings(cls):
         """Clear all plugin settings"""
-        settings = QgsSettings()
+        settings = cls._get_qsettings()
         settings.beginGroup(cls.SETTINGS_PREFIX)
         settings.remove("")
         settings.endGroup()
+        cls._cache.clear()
+        cls._memo.clear()
+        cls._prefetched = False
+
+
+def _add_accessors(cls):
+    """Generate get_<name>/set_<name> classmethods from the settings table"""
+    for name, (default, description) in cls._KEYS.items():
+        if f"get_{name}" not in vars(cls):
+            def getter(cls, _name=name):
+                return cls.get_setting(_name)
+            getter.__name__ = f"get_{name}"
+            getter.__doc__ = f"Get {description}"
+            setattr(cls, getter.__name__, classmethod(_memoized(getter)))
+            
+        if f"set_{name}" not in vars(cls):
+            def setter(cls, value, _name=name):
+                cls.set_setting(_name, value)
+            setter.__name__ = f"set_{name}"
+            setter.__doc__ = f"Set {description}"
+            setattr(cls, setter.__name__, classmethod(setter))
+
+_add_accessors(SettingsManager)
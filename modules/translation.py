@@ -4,20 +4,322 @@ Handles all translation-related functionality.
 """
 
 from qgis.core import (QgsTask, QgsApplication, QgsMessageLog, Qgis, 
-                      QgsVectorLayer, QgsField, QgsFeature, QgsFeatureRequest)
+                      QgsVectorLayer, QgsField, QgsFeature, QgsFeatureRequest,
+                      QgsExpression)
 from PyQt5.QtCore import QVariant
+import hashlib
+import os
+import random
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from itertools import islice
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
 from .settings_manager import SettingsManager
 
+# orjson works on bytes directly and is much faster on the Unicode-heavy
+# bodies translations produce. It is optional.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
+
+def _json_dumps(obj):
+    """Serialize obj to JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    # Like orjson: compact, with non-ASCII text kept as UTF-8 rather than
+    # escaped to \uXXXX (which triples the size of e.g. Arabic prompts)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _json_loads(data):
+    """Parse JSON from bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# List item line of a batch response: "3. text", "3) text", "[3] text" or a
+# bullet. Numbers are capped at three digits so a leading year is kept.
+_LIST_ITEM_RE = re.compile(r'(?:\d{1,3}[.)]|\[\s*\d{1,3}\s*\]|[-*\u2022])\s+(.*)')
+
+# Retries for failed Ollama requests, with full-jitter exponential backoff
+MAX_RETRIES = 2
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 8.0
+
+# Longest Retry-After wait (seconds) a rate-limited request will honour
+RETRY_AFTER_CAP = 60
+
+# Response statuses worth retrying: rate limiting and transient server errors.
+# Any other 4xx/5xx fails straight away.
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+# Translation cache file in the QGIS profile directory, and how long its
+# entries are kept by default (the plugin uses the translation_cache_days
+# setting)
+CACHE_FILE_NAME = 'clean_data_translations.sqlite'
+CACHE_MAX_AGE = 90 * 24 * 3600
+
+# Part of every stored cache key; bump it when cleaning or parsing changes
+# what a cached translation would be, so older entries stop matching
+CACHE_VERSION = 1
+
+# Default number of chunks a task translates at once; each chunk sends its
+# requests one after another, so this is also the number of open requests
+CHUNKS_IN_FLIGHT = 2
+
+# Minimum seconds between progress reports from a running task
+PROGRESS_INTERVAL = 0.1
+
+# Seconds between cancel checks while a task waits for a chunk
+CANCEL_POLL_INTERVAL = 0.2
+
+# Log informational detail (parsed responses, per-batch progress); warnings
+# and errors are always logged
+DEBUG = False
+
+# Stands in for the text placeholders while a prompt template is split
+_TEXT_SLOT = '\x00'
+
+
+@lru_cache(maxsize=64)
+def _prompt_parts(prompt_template, target_lang, batch_size):
+    """Format a prompt template except for its text, split where the text goes
+    
+    Both the single ({text}) and the batch ({texts}, {batch_size})
+    placeholders are supplied, so either kind of template works in either mode.
+    """
+    return tuple(prompt_template.format(
+        target_lang=target_lang,
+        batch_size=batch_size,
+        text=_TEXT_SLOT,
+        texts=_TEXT_SLOT
+    ).split(_TEXT_SLOT))
+
+
+def _never_canceled():
+    """Default cancel check for calls made outside a task"""
+    return False
+
+
+def _shutdown_now(executor):
+    """Shut an executor down without waiting, dropping work not yet started"""
+    try:
+        executor.shutdown(wait=False, cancel_futures=True)
+    except TypeError:
+        # cancel_futures needs Python 3.9; queued work still runs, but
+        # returns at once since it checks for the cancel first
+        executor.shutdown(wait=False)
+
+
+class TranslationCache:
+    """Thread-safe LRU of finished translations, optionally backed by SQLite"""
+    
+    def __init__(self, maxsize=50000, path=None, max_age=CACHE_MAX_AGE):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            try:
+                self._db = self._open(path, max_age)
+            except sqlite3.Error as e:
+                QgsMessageLog.logMessage(
+                    f"Translation cache file unavailable, caching in memory only: {str(e)}",
+                    'Clean Data',
+                    Qgis.Warning
+                )
+                
+    @staticmethod
+    def _open(path, max_age):
+        """Open the cache database and drop expired entries"""
+        db = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute("CREATE TABLE IF NOT EXISTS trans (key BLOB PRIMARY KEY, val TEXT, ts INTEGER)")
+        db.execute("DELETE FROM trans WHERE ts < ?", (int(time.time()) - max_age,))
+        return db
+        
+    @staticmethod
+    def _db_key(key):
+        """Fixed-size database key for a tuple key"""
+        return hashlib.blake2b(f"{CACHE_VERSION}|{'|'.join(map(str, key))}".encode('utf-8'),
+                               digest_size=16).digest()
+        
+    def _drop_db(self, error):
+        """Stop using the cache file after an error, keeping the memory cache"""
+        QgsMessageLog.logMessage(
+            f"Translation cache file failed, caching in memory only: {str(error)}",
+            'Clean Data',
+            Qgis.Warning
+        )
+        try:
+            self._db.close()
+        except sqlite3.Error:
+            pass
+        self._db = None
+        
+    def close(self):
+        """Close the cache file; later lookups use the memory cache only"""
+        with self._lock:
+            if self._db is not None:
+                try:
+                    self._db.close()
+                except sqlite3.Error:
+                    pass
+                self._db = None
+                
+    def _remember(self, key, value):
+        """Store in memory, evicting the least recently used entry if full"""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            
+    def get_many(self, keys):
+        """Get cached translations for keys, None where there is none"""
+        with self._lock:
+            results = []
+            for key in keys:
+                value = self._data.get(key)
+                if value is not None:
+                    self._data.move_to_end(key)
+                results.append(value)
+                
+            if self._db is None:
+                return results
+                
+            # Look the memory misses up on disk, a bounded IN (...) at a time
+            positions = {}
+            for i, value in enumerate(results):
+                if value is None:
+                    positions.setdefault(self._db_key(keys[i]), []).append(i)
+            db_keys = list(positions)
+            try:
+                for start in range(0, len(db_keys), 500):
+                    chunk = db_keys[start:start + 500]
+                    rows = self._db.execute(
+                        f"SELECT key, val FROM trans WHERE key IN ({','.join('?' * len(chunk))})",
+                        chunk
+                    ).fetchall()
+                    for db_key, value in rows:
+                        for i in positions[db_key]:
+                            results[i] = value
+                        self._remember(keys[positions[db_key][0]], value)
+            except sqlite3.Error as e:
+                self._drop_db(e)
+            return results
+            
+    def put_many(self, items):
+        """Store (key, translation) pairs"""
+        with self._lock:
+            for key, value in items:
+                self._remember(key, value)
+            if self._db is not None and items:
+                now = int(time.time())
+                try:
+                    self._db.execute("BEGIN")
+                    self._db.executemany(
+                        "INSERT OR REPLACE INTO trans VALUES (?, ?, ?)",
+                        [(self._db_key(key), value, now) for key, value in items]
+                    )
+                    self._db.execute("COMMIT")
+                except sqlite3.Error as e:
+                    # e.g. "database is locked" by another QGIS instance; end
+                    # the transaction so the connection isn't left inside it
+                    if self._db.in_transaction:
+                        try:
+                            self._db.execute("ROLLBACK")
+                        except sqlite3.Error:
+                            pass
+                    self._drop_db(e)
+
 class TranslationService:
     """Base class for translation services"""
+    
+    # Translation cache shared by every service and kept on disk, so a
+    # repeated value is only ever sent once. Opened on first use.
+    _cache = None
+    _cache_lock = threading.Lock()
+    
+    # Chunks a task translates at once. The task's chunks are the only level
+    # of concurrency; a service sends one chunk's requests in sequence.
+    chunks_in_flight = CHUNKS_IN_FLIGHT
+    
+    # Largest batch a task will ask this service for
+    max_batch_size = 5
+    
     def translate(self, texts, target_lang, **kwargs):
         raise NotImplementedError("Subclasses must implement translate()")
+        
+    @classmethod
+    def _get_cache(cls):
+        """Get the shared translation cache"""
+        with cls._cache_lock:
+            if TranslationService._cache is None:
+                TranslationService._cache = TranslationCache(
+                    path=os.path.join(QgsApplication.qgisSettingsDirPath(), CACHE_FILE_NAME),
+                    max_age=SettingsManager.get_translation_cache_days() * 24 * 3600
+                )
+            return TranslationService._cache
+            
+    @classmethod
+    def close_cache(cls):
+        """Close the shared translation cache; the next use opens it again"""
+        with cls._cache_lock:
+            if TranslationService._cache is not None:
+                TranslationService._cache.close()
+                TranslationService._cache = None
+            
+    def _translate_cached(self, texts, key_prefix, translate_uncached):
+        """Translate texts through the cache, sending each distinct miss once
+        
+        key_prefix is (service, model, source_lang, target_lang, prompt_template)
+        and translate_uncached takes a list of texts and returns their translations.
+        """
+        cache = self._get_cache()
+        keys = [key_prefix + (text,) for text in texts]
+        results = cache.get_many(keys)
+        misses = [i for i, result in enumerate(results) if result is None]
+        if not misses:
+            return results
+            
+        # Send each distinct text once and fan the results back out
+        pending = list(dict.fromkeys(texts[i] for i in misses))
+        translated = dict(zip(pending, translate_uncached(pending)))
+        for i in misses:
+            results[i] = translated[texts[i]]
+        cache.put_many([(key_prefix + (text,), translation)
+                        for text, translation in translated.items() if translation])
+                        
+        return results
+        
+    def close(self):
+        """Release any resources held by the service"""
+        pass
 
 class GoogleTranslateService(TranslationService):
     """Google Cloud Translation API implementation"""
     
+    # Each chunk is usually a single request here, so tasks run more of them
+    # at once
+    chunks_in_flight = 8
+    
+    # Google's per-request limit; batches are sent as a POST form body, so
+    # a full batch is not bound by URL length limits
+    max_batch_size = 128
+    
     def __init__(self):
         # Get API key from settings
         api_key = SettingsManager.get_google_api_key()
@@ -27,17 +329,42 @@ class GoogleTranslateService(TranslationService):
         self.api_key = api_key
         self.base_url = "https://translation.googleapis.com/language/translate/v2"
         
+        # Keep the TLS connection alive across batches and let the adapter
+        # retry rate limiting and transient server errors, for the batch
+        # POSTs too since translating is safe to repeat
+        self._session = requests.Session()
+        retry = dict(total=3, backoff_factor=0.3, status_forcelist=RETRY_STATUSES)
+        try:
+            retry = Retry(allowed_methods=None, **retry)
+        except TypeError:
+            # urllib3 before 1.26
+            retry = Retry(method_whitelist=False, **retry)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.chunks_in_flight,
+                              max_retries=retry)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        
+        # Every request carries the key
+        self._session.params = {'key': api_key}
+        
+        # The key is checked once per service, before its first translation
+        self._verified = False
+        self._verify_lock = threading.Lock()
+        
+    def close(self):
+        """Close the pooled HTTP session"""
+        self._session.close()
+        
     def _verify_api_key(self):
         """Verify the API key works"""
         try:
             # Try a simple translation to verify the key
             params = {
                 'q': 'test',
-                'target': 'ar',
-                'key': self.api_key
+                'target': 'ar'
             }
             
-            response = requests.get(self.base_url, params=params, timeout=5)
+            response = self._session.get(self.base_url, params=params, timeout=5)
             if response.status_code == 403:
                 raise ValueError(
                     "Invalid or restricted Google API key. Please check:\n"
@@ -49,16 +376,17 @@ class GoogleTranslateService(TranslationService):
             
             response.raise_for_status()
             
-            result = response.json()
+            result = _json_loads(response.content)
             if 'error' in result:
                 error_msg = result['error'].get('message', 'Unknown error')
                 raise ValueError(f"API key verification failed: {error_msg}")
                 
-            QgsMessageLog.logMessage(
-                "Google Translate API key verified successfully",
-                'Clean Data',
-                Qgis.Info
-            )
+            if DEBUG:
+                QgsMessageLog.logMessage(
+                    "Google Translate API key verified successfully",
+                    'Clean Data',
+                    Qgis.Info
+                )
             
         except requests.exceptions.RequestException as e:
             if '403' in str(e):
@@ -72,14 +400,39 @@ class GoogleTranslateService(TranslationService):
             raise ValueError(f"Failed to verify Google Translate API key: {str(e)}")
             
     def translate(self, texts, target_lang, batch_mode=True, batch_size=50, 
-                 source_lang='auto', **kwargs):
+                 source_lang='auto', is_canceled=None, **kwargs):
         """Translate texts using Google Cloud Translation API"""
         if not texts:
             return []
             
-        # First verify API key to fail fast
+        # Clean and validate input texts
+        texts = [str(t).strip() for t in texts]
+        texts = [t for t in texts if t]  # Remove empty texts
+        
+        if not texts:
+            return []
+            
+        return self._translate_cached(
+            texts, ('google', None, source_lang, target_lang, None),
+            lambda pending: self._translate_uncached(pending, target_lang, batch_mode,
+                                                     batch_size, source_lang, is_canceled)
+        )
+        
+    def _translate_uncached(self, texts, target_lang, batch_mode, batch_size, source_lang,
+                            is_canceled=None):
+        """Translate texts that are not in the cache
+        
+        is_canceled is checked before each request; once it returns True the
+        remaining texts are left untranslated.
+        """
+        is_canceled = is_canceled or _never_canceled
+        # First verify API key to fail fast, once per service; concurrent
+        # chunks wait for the first check instead of repeating it
         try:
-            self._verify_api_key()
+            with self._verify_lock:
+                if not self._verified:
+                    self._verify_api_key()
+                    self._verified = True
         except ValueError as e:
             QgsMessageLog.logMessage(
                 f"Google Translate API verification failed: {str(e)}",
@@ -89,63 +442,57 @@ class GoogleTranslateService(TranslationService):
             # Return empty strings for all texts since we can't translate
             return [""] * len(texts)
             
-        # Clean and validate input texts
-        texts = [str(t).strip() for t in texts]
-        texts = [t for t in texts if t]  # Remove empty texts
-        
-        if not texts:
-            return []
-            
-        # Use a reasonable batch size (Google's limit is 128)
-        batch_size = min(batch_size, 100)  # Use 100 as safe limit
+        # Never exceed Google's per-request limit
+        batch_size = min(batch_size, self.max_batch_size)
         
         if not batch_mode or len(texts) == 1:
-            return [self._translate_single(text, target_lang, source_lang)
-                   for text in texts]
+            return ["" if is_canceled() else
+                    self._translate_single(text, target_lang, source_lang)
+                    for text in texts]
         
-        # Process in batches
-        all_translations = []
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-            
+        # Process in batches; each batch fills its own slice of the
+        # preallocated result
+        starts = range(0, len(texts), batch_size)
+        all_translations = [""] * len(texts)
+        for start in starts:
+            if is_canceled():
+                break
+            batch = texts[start:start + batch_size]
             try:
                 batch_translations = self._translate_batch(batch, target_lang, source_lang)
-                if batch_translations:
-                    all_translations.extend(batch_translations)
-                else:
+                if not batch_translations:
                     # If batch fails, try one by one
                     QgsMessageLog.logMessage(
                         f"Batch translation failed, falling back to single mode for {len(batch)} texts",
                         'Clean Data',
                         Qgis.Warning
                     )
-                    for text in batch:
-                        trans = self._translate_single(text, target_lang, source_lang)
-                        all_translations.append(trans if trans else "")
-                        
+                    batch_translations = [
+                        "" if is_canceled() else
+                        self._translate_single(text, target_lang, source_lang) or ""
+                        for text in batch
+                    ]
+                all_translations[start:start + len(batch)] = batch_translations
+                
             except Exception as e:
                 if '403' in str(e):
+                    # The remaining batches would be rejected too
                     QgsMessageLog.logMessage(
                         "Google API authentication failed. Please check your API key and permissions.",
                         'Clean Data',
                         Qgis.Critical
                     )
-                    # Fill remaining translations with empty strings
-                    remaining = len(texts) - len(all_translations)
-                    all_translations.extend([""] * remaining)
-                    break  # Stop processing on auth error
-                else:
-                    QgsMessageLog.logMessage(
-                        f"Error in batch {i//batch_size + 1}: {str(e)}",
-                        'Clean Data',
-                        Qgis.Warning
-                    )
-                    # Add empty strings for failed batch
-                    all_translations.extend([""] * len(batch))
+                    break
+                QgsMessageLog.logMessage(
+                    f"Error in batch {start//batch_size + 1}: {str(e)}",
+                    'Clean Data',
+                    Qgis.Warning
+                )
                 
-            # Log progress
+
+        if DEBUG:
             QgsMessageLog.logMessage(
-                f"Translated {len(all_translations)}/{len(texts)} texts",
+                f"Translated {len(texts)} texts in {len(starts)} batches",
                 'Clean Data',
                 Qgis.Info
             )
@@ -160,17 +507,16 @@ class GoogleTranslateService(TranslationService):
         try:
             params = {
                 'q': text,
-                'target': target_lang,
-                'key': self.api_key
+                'target': target_lang
             }
             
             if source_lang.lower() != 'auto':
                 params['source'] = source_lang
                 
-            response = requests.get(self.base_url, params=params, timeout=30)
+            response = self._session.get(self.base_url, params=params, timeout=30)
             response.raise_for_status()
             
-            result = response.json()
+            result = _json_loads(response.content)
             if 'data' in result and 'translations' in result['data']:
                 translation = result['data']['translations'][0].get('translatedText', '')
                 return translation.strip()
@@ -191,46 +537,66 @@ class GoogleTranslateService(TranslationService):
             return ""
             
     def _translate_batch(self, texts, target_lang, source_lang='auto'):
-        """Translate a batch of texts"""
+        """Translate a batch of texts, or return None if the batch failed"""
         if not texts:
             return []
             
         try:
-            # Build query parameters
-            params = {
+            # Sent as a form body rather than query parameters, which a full
+            # batch of long texts would push past URL length limits
+            data = {
                 'q': texts,  # Google API accepts list of strings
-                'target': target_lang,
-                'key': self.api_key
+                'target': target_lang
             }
             
             if source_lang.lower() != 'auto':
-                params['source'] = source_lang
+                data['source'] = source_lang
                 
-            response = requests.get(self.base_url, params=params, timeout=30)
+            response = self._session.post(self.base_url, data=data, timeout=30)
             response.raise_for_status()
             
-            result = response.json()
-            if 'data' in result and 'translations' in result['data']:
-                return [t.get('translatedText', '').strip() for t in result['data']['translations']]
+            result = _json_loads(response.content)
+            translations = result.get('data', {}).get('translations')
+            if isinstance(translations, list) and len(translations) == len(texts):
+                return [t.get('translatedText', '').strip() for t in translations]
             else:
                 QgsMessageLog.logMessage(
                     f"Invalid response format: {result}",
                     'Clean Data',
                     Qgis.Warning
                 )
-                return [""] * len(texts)
+                return None
                 
+        except requests.HTTPError as e:
+            # Retrying text by text cannot fix a rejected key
+            if e.response is not None and e.response.status_code == 403:
+                raise
+            QgsMessageLog.logMessage(
+                f"Batch translation failed: {str(e)}",
+                'Clean Data',
+                Qgis.Critical
+            )
+            return None
+            
         except Exception as e:
             QgsMessageLog.logMessage(
                 f"Batch translation failed: {str(e)}",
                 'Clean Data',
                 Qgis.Critical
             )
-            return [""] * len(texts)
+            return None
 
 class OllamaService(TranslationService):
     """Ollama API implementation"""
     
+    # Longer numbered lists make models drop or merge lines
+    max_batch_size = 10
+    
+    @property
+    def chunks_in_flight(self):
+        """Chunks translated at once, from the Parallel Requests setting"""
+        return SettingsManager.get_ollama_parallel()
+    
     def __init__(self):
         """Initialize Ollama service"""
         # Get base URL from settings
@@ -244,15 +610,49 @@ class OllamaService(TranslationService):
         # Get default model from settings
         self.default_model = SettingsManager.get_ollama_model()
         
+        # Keep connections to the server alive across batches
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=0)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        
+        # Request bodies are posted as prebuilt JSON bytes
+        self._session.headers['Content-Type'] = 'application/json'
+        
         self._check_connection()
         
+    def close(self):
+        """Close the pooled HTTP session"""
+        self._session.close()
+        
+    def _post(self, data, stream=False):
+        """POST to the generate endpoint, retrying connection errors and RETRY_STATUSES"""
+        payload = _json_dumps(data)
+        for attempt in range(MAX_RETRIES + 1):
+            # Spread retries out so parallel batches don't hit the server together
+            delay = random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+            try:
+                response = self._session.post(self.url, data=payload, timeout=(5, 300),
+                                              stream=stream)
+                if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    return response
+                # Wait as long as the server asks, when it says
+                retry_after = response.headers.get('Retry-After', '')
+                if retry_after.isdigit():
+                    delay = min(int(retry_after), RETRY_AFTER_CAP)
+                response.close()
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == MAX_RETRIES:
+                    raise
+            time.sleep(delay)
+        
     def _check_connection(self):
         """Check connection to Ollama server and get available models"""
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self._session.get(f"{self.base_url}/api/tags", timeout=5)
             response.raise_for_status()
             
-            models = [model['name'] for model in response.json()['models']]
+            models = [model['name'] for model in _json_loads(response.content)['models']]
             QgsMessageLog.logMessage(
                 f"Connected to Ollama server at {self.base_url}. Available models: {', '.join(models)}",
                 'Clean Data',
@@ -279,7 +679,7 @@ class OllamaService(TranslationService):
             raise ValueError(f"Failed to connect to Ollama server at {self.base_url}: {str(e)}")
             
     def translate(self, texts, target_lang, model=None, batch_mode=True, batch_size=5,
-                 prompt_template=None, source_lang='auto', instructions=''):
+                 prompt_template=None, source_lang='auto', instructions='', is_canceled=None):
         """Translate texts using Ollama API"""
         if not texts:
             return []
@@ -301,28 +701,50 @@ class OllamaService(TranslationService):
                 "Only return the translation, no explanations:\n\n{text}"
             )
             
+        # Serve repeated values from the cache and only send the misses; the
+        # prompt is part of the key since it shapes the translation
+        return self._translate_cached(
+            texts, ('ollama', model, source_lang, target_lang, prompt_template),
+            lambda pending: self._translate_uncached(pending, target_lang, model, batch_mode,
+                                                     batch_size, prompt_template, is_canceled)
+        )
+        
+    def _translate_uncached(self, texts, target_lang, model, batch_mode, batch_size,
+                            prompt_template, is_canceled=None):
+        """Translate texts that are not in the cache
+        
+        is_canceled is checked before each request; once it returns True the
+        remaining texts are left untranslated.
+        """
+        is_canceled = is_canceled or _never_canceled
+        
         # Process in batches or single mode
         if not batch_mode or len(texts) == 1:
-            return [self._translate_single(text, target_lang, model, prompt_template)
-                   for text in texts]
+            return ["" if is_canceled() else
+                    self._translate_single(text, target_lang, model, prompt_template)
+                    for text in texts]
                    
-        # Process in batches
-        translations = []
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
+        # Process in batches; each batch fills its own slice of the
+        # preallocated result
+        translations = [""] * len(texts)
+        for start in range(0, len(texts), batch_size):
+            if is_canceled():
+                break
+            batch = texts[start:start + batch_size]
             batch_translations = self._translate_batch(batch, target_lang, model, prompt_template)
-            if batch_translations:
-                translations.extend(batch_translations)
-            else:
+            if not batch_translations:
                 # If batch fails, try one by one
                 QgsMessageLog.logMessage(
                     f"Batch translation failed, falling back to single mode for {len(batch)} texts",
                     'Clean Data',
                     Qgis.Warning
                 )
-                for text in batch:
-                    trans = self._translate_single(text, target_lang, model, prompt_template)
-                    translations.append(trans if trans else "")
+                batch_translations = [
+                    "" if is_canceled() else
+                    self._translate_single(text, target_lang, model, prompt_template) or ""
+                    for text in batch
+                ]
+            translations[start:start + len(batch)] = batch_translations
                     
         return translations
         
@@ -333,10 +755,7 @@ class OllamaService(TranslationService):
             
         try:
             # Format prompt with text
-            prompt = prompt_template.format(
-                target_lang=target_lang,
-                text=text
-            )
+            prompt = text.join(_prompt_parts(prompt_template, target_lang, 1))
             
             data = {
                 "model": model,
@@ -344,10 +763,10 @@ class OllamaService(TranslationService):
                 "stream": False
             }
             
-            response = requests.post(self.url, json=data, timeout=30)
+            response = self._post(data)
             response.raise_for_status()
             
-            result = response.json()
+            result = _json_loads(response.content)
             if not result or 'response' not in result:
                 raise ValueError("Invalid response format")
                 
@@ -366,87 +785,150 @@ class OllamaService(TranslationService):
             return ""
             
     def _translate_batch(self, texts, target_lang, model, prompt_template):
-        """Translate a batch of texts"""
+        """Translate a batch of texts, or return None if the batch failed"""
         if not texts:
             return []
             
         try:
             # Join texts with numbering for better context
-            numbered_texts = "\n".join(f"{i+1}. {text}" for i, text in enumerate(texts))
+            numbered_texts = "\n".join([f"{i}. {text}" for i, text in enumerate(texts, 1)])
             
-            # Format prompt with all texts
-            prompt = prompt_template.format(
-                target_lang=target_lang,
-                text=numbered_texts
-            )
+            # Format prompt with all texts, once per batch; retries reuse the
+            # serialized payload
+            prompt = numbered_texts.join(_prompt_parts(prompt_template, target_lang, len(texts)))
             
             data = {
                 "model": model,
                 "prompt": prompt,
-                "stream": False
+                "stream": True
             }
             
-            response = requests.post(self.url, json=data, timeout=30)
-            response.raise_for_status()
-            
-            result = response.json()
-            if not result or 'response' not in result:
-                raise ValueError("Invalid response format")
+            with self._post(data, stream=True) as response:
+                response.raise_for_status()
+                response_text = self._read_stream(response, len(texts))
                 
-            # Split response by numbers and clean up
-            translation = result['response'].strip()
-            translations = []
+            return self._parse_translations_list(response_text, len(texts))
             
-            # Try to split by numbered lines first
-            lines = translation.split('\n')
-            current_translation = []
-            
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                    
-                # Check if line starts with a number
-                if line[0].isdigit() and '. ' in line:
-                    if current_translation:
-                        translations.append(' '.join(current_translation))
-                        current_translation = []
-                    # Remove the number prefix
-                    text = line.split('. ', 1)[1]
-                    current_translation.append(text)
-                else:
-                    current_translation.append(line)
-                    
-            # Add the last translation
-            if current_translation:
-                translations.append(' '.join(current_translation))
-                
-            # If we didn't get the right number of translations, try simple line splitting
-            if len(translations) != len(texts):
-                translations = [line.strip() for line in translation.split('\n') if line.strip()]
+        except Exception as e:
+            QgsMessageLog.logMessage(
+                f"Batch translation failed: {str(e)}",
+                'Clean Data',
+                Qgis.Critical
+            )
+            return None
+            
+    def _read_stream(self, response, expected_count):
+        """Collect a streamed generation, stopping once it runs past the batch"""
+        pieces = []
+        line = ""
+        items = 0
+        for chunk in response.iter_lines():
+            if not chunk:
+                continue
+            result = _json_loads(chunk)
+            if 'error' in result:
+                raise ValueError(result['error'])
+            if 'response' not in result:
+                raise ValueError("Invalid response format")
                 
-            # Ensure we have the right number of translations
-            if len(translations) != len(texts):
-                QgsMessageLog.logMessage(
-                    f"Got {len(translations)} translations, expected {len(texts)}",
-                    'Clean Data',
-                    Qgis.Warning
-                )
-                # Pad with empty strings if needed
-                while len(translations) < len(texts):
-                    translations.append("")
-                # Truncate if we got too many
-                translations = translations[:len(texts)]
+            piece = result['response']
+            pieces.append(piece)
+            if result.get('done'):
+                break
                 
+            # Count finished list items; one more than requested means the
+            # model is running on, so stop waiting for the rest. Leaving the
+            # with-block closes the connection and cancels the generation.
+            line += piece
+            if '\n' in line:
+                *finished, line = line.split('\n')
+                items += sum(1 for done in finished if _LIST_ITEM_RE.match(done.strip()))
+                if items > expected_count:
+                    QgsMessageLog.logMessage(
+                        f"Model returned more than {expected_count} items, stopping generation early",
+                        'Clean Data',
+                        Qgis.Warning
+                    )
+                    break
+                    
+        return "".join(pieces)
+        
+    @staticmethod
+    def _parse_json_list(response_text, expected_count):
+        """Get the translations from a JSON array response, None if it isn't one"""
+        text = response_text.strip()
+        # Models like to wrap JSON in a ```json code fence
+        if text.startswith('```'):
+            text = text.strip('`').partition('\n')[2].strip()
+        if not text.startswith('['):
+            return None
+        try:
+            items = _json_loads(text)
+        except ValueError:
+            return None
+        if not isinstance(items, list) or len(items) != expected_count:
+            return None
+        return ["" if item is None else str(item).strip() for item in items]
+        
+    def _parse_translations_list(self, response_text, expected_count):
+        """Split a numbered-list response into exactly expected_count translations"""
+        # A JSON array of the right length, as prompts asking for JSON get
+        # back, is taken as is
+        translations = self._parse_json_list(response_text, expected_count)
+        if translations is not None:
             return translations
             
-        except Exception as e:
+        # Non-blank lines, stripped once and shared by both passes
+        lines = [line for line in map(str.strip, response_text.splitlines()) if line]
+        # List marker match (or None) per line, also shared by both passes
+        matches = list(map(_LIST_ITEM_RE.match, lines))
+        translations = []
+        
+        # Try to split by numbered lines first
+        current_translation = []
+        
+        for line, match in zip(lines, matches):
+            # Check if line starts with a list marker
+            if match:
+                if current_translation:
+                    translations.append(' '.join(current_translation))
+                    current_translation = []
+                # Keep the text after the marker
+                current_translation.append(match.group(1))
+            else:
+                current_translation.append(line)
+                
+        # Add the last translation
+        if current_translation:
+            translations.append(' '.join(current_translation))
+            
+        # If we didn't get the right number of translations, fall back to one
+        # translation per line, still dropping any list marker
+        if len(translations) != expected_count:
+            translations = [match.group(1) if match else line
+                            for line, match in zip(lines, matches)]
+            
+        if DEBUG:
             QgsMessageLog.logMessage(
-                f"Batch translation failed: {str(e)}",
+                "Parsed translations:\n" + "\n".join(translations),
                 'Clean Data',
-                Qgis.Critical
+                Qgis.Info
             )
-            return [""] * len(texts)
+            
+        # Ensure we have the right number of translations
+        if len(translations) != expected_count:
+            QgsMessageLog.logMessage(
+                f"Got {len(translations)} translations, expected {expected_count}",
+                'Clean Data',
+                Qgis.Warning
+            )
+            # Pad with empty strings if needed
+            while len(translations) < expected_count:
+                translations.append("")
+            # Truncate if we got too many
+            translations = translations[:expected_count]
+            
+        return translations
 
 class TranslationTask(QgsTask):
     """Task for handling translations in background"""
@@ -465,7 +947,7 @@ class TranslationTask(QgsTask):
         self.target_lang = target_lang
         self.model = model
         self.batch_mode = batch_mode
-        self.batch_size = min(batch_size, 5)  # Limit batch size for safety
+        self.batch_size = min(batch_size, service.max_batch_size)  # Limit to what the service handles well
         self.prompt_template = prompt_template
         self.source_lang = source_lang
         self.instructions = instructions
@@ -478,34 +960,39 @@ class TranslationTask(QgsTask):
             self.skip_values = {v.strip() for v in skip_values.split(',')}
         
         # Initialize state
-        self.features_to_translate = []
         self.total_features = 0
         self.translated_count = 0
         self.exception = None
         self.failed_features = []
         self.skipped_features = []
+        # Skipped features including those the request filter left out,
+        # whose ids are never fetched
+        self.skipped_count = 0
         
-    def _should_skip_text(self, text, existing_translation=None):
-        """Check if text should be skipped"""
-        if text is None or str(text).strip() == "":
-            return True
-            
-        # Skip if text matches any of the skip values
-        if str(text).strip() in self.skip_values:
-            return True
+    def _text_to_translate(self, source_text, existing_translation=None):
+        """Return the stripped source text to translate, or None to skip the feature"""
+        if source_text is None:
+            return None
+        text = source_text.strip() if isinstance(source_text, str) else str(source_text).strip()
+        
+        # Skip empty text and text matching any of the skip values
+        if not text or text in self.skip_values:
+            return None
             
         # Skip if already translated
-        if existing_translation and str(existing_translation).strip():
-            return True
+        if existing_translation and (
+                existing_translation.strip() if isinstance(existing_translation, str)
+                else str(existing_translation).strip()):
+            return None
             
-        return False
+        return text
         
     def run(self):
         """Run the translation task"""
         try:
-            # First, get all features and store them in memory
-            all_features = []
-            feature_map = {}
+            # Features to translate, grouped by their source text so each
+            # distinct text is translated once: text -> [fid, ...]
+            fids_by_text = {}
             
             # Get field indices
             source_idx = self.layer.fields().indexOf(self.source_field)
@@ -514,7 +1001,8 @@ class TranslationTask(QgsTask):
             
             # Create target field if it doesn't exist
             target_idx = self.layer.fields().indexOf(self.target_field)
-            if target_idx < 0:
+            resuming = target_idx >= 0
+            if not resuming:
                 if not self.layer.startEditing():
                     raise ValueError("Failed to start editing layer")
                 self.layer.addAttribute(QgsField(self.target_field, QVariant.String))
@@ -524,41 +1012,61 @@ class TranslationTask(QgsTask):
             
             # Store initial feature count for verification
             initial_count = self.layer.featureCount()
-            QgsMessageLog.logMessage(
-                f"Initial feature count: {initial_count}",
-                'Clean Data',
-                Qgis.Info
-            )
+            if DEBUG:
+                QgsMessageLog.logMessage(
+                    f"Initial feature count: {initial_count}",
+                    'Clean Data',
+                    Qgis.Info
+                )
             
             # Safely get all features first
             request = QgsFeatureRequest()
             request.setFlags(QgsFeatureRequest.NoGeometry)  # We don't need geometry
             request.setSubsetOfAttributes([source_idx, target_idx])  # Get both source and target fields
             
+            # Leave out rows that would be skipped below where an expression
+            # can tell; providers like PostGIS and GeoPackage run this filter
+            # in their own query. _text_to_translate still covers the rest.
+            filters = []
+            if resuming:
+                # Only fetch rows a previous (e.g. canceled) run left
+                # untranslated; whitespace-only counts as empty, as below
+                target_ref = QgsExpression.quotedColumnRef(self.target_field)
+                filters.append(f"({target_ref} IS NULL OR trim({target_ref}) = '')")
+            if self.layer.fields().at(source_idx).type() == QVariant.String:
+                # Exact matches only, so limited to text fields where the
+                # stored value and the compared text are the same string
+                source_ref = QgsExpression.quotedColumnRef(self.source_field)
+                filters.append(f"{source_ref} IS NOT NULL")
+                if self.skip_values:
+                    skipped = ', '.join(map(QgsExpression.quotedString, sorted(self.skip_values)))
+                    filters.append(f"{source_ref} NOT IN ({skipped})")
+            if filters:
+                expression = QgsExpression(' AND '.join(filters))
+                if not expression.hasParserError():
+                    request.setFilterExpression(expression.expression())
+            
+            text_to_translate = self._text_to_translate
+            skip = self.skipped_features.append
+            fetched = 0
             for feature in self.layer.getFeatures(request):
-                fid = feature.id()
-                source_text = feature[source_idx]
-                existing_translation = feature[target_idx]
-                
-                # Skip if conditions are met
-                if self._should_skip_text(source_text, existing_translation):
-                    self.skipped_features.append(fid)
+                fetched += 1
+                attributes = feature.attributes()
+                text = text_to_translate(attributes[source_idx], attributes[target_idx])
+                if text is None:
+                    skip(feature.id())
                     continue
                     
-                # Store feature data
-                feature_data = {
-                    'id': fid,
-                    'text': str(source_text).strip(),
-                    'translated': False
-                }
-                
-                all_features.append(feature_data)
-                feature_map[fid] = feature_data
+                fids_by_text.setdefault(text, []).append(feature.id())
+            
+            # Rows left out by the filter were skipped just the same
+            filtered_out = max(0, initial_count - fetched) if request.filterExpression() else 0
+            self.skipped_count = filtered_out + len(self.skipped_features)
             
-            self.total_features = len(feature_map)
+            self.total_features = sum(map(len, fids_by_text.values()))
             if self.total_features == 0:
                 QgsMessageLog.logMessage(
-                    f"No features to translate (skipped {len(self.skipped_features)} features)",
+                    f"No features to translate (skipped {self.skipped_count} features)",
                     'Clean Data',
                     Qgis.Warning
                 )
@@ -571,76 +1079,102 @@ class TranslationTask(QgsTask):
             )
             
             # Process in smaller chunks with minimal batch size
-            chunk_size = 25  # Process 25 features at a time
-            batch_size = min(2, self.batch_size)  # Start with small batches
+            # Process at least 25 distinct texts at a time, and never fewer
+            # than one full batch
+            batch_size = self.batch_size
+            chunk_size = max(25, batch_size)
             
-            # Start editing once for all changes
+            # Start editing; each finished chunk is committed as it is written
             if not self.layer.startEditing():
                 raise ValueError("Failed to start editing layer")
             
             try:
-                # Process features in chunks
-                feature_ids = list(feature_map.keys())
-                for chunk_start in range(0, len(feature_ids), chunk_size):
-                    if self.isCanceled():
-                        self.layer.rollBack()
-                        return False
+                # Chunks are translated on worker threads, as many at a time
+                # as the service allows, while this thread writes finished
+                # chunks back in order; layer edits never leave the task thread
+                items = iter(fids_by_text.items())
+                chunks = iter(lambda: list(islice(items, chunk_size)), [])
+                in_flight = deque()
+                workers = self.service.chunks_in_flight
+                last_progress = 0.0
+                # Managed by hand: leaving a with-block would wait for every
+                # running chunk, which can take minutes after a cancel
+                executor = ThreadPoolExecutor(max_workers=workers)
+                try:
+                    def submit(chunk):
+                        texts = [text for text, _ in chunk]
+                        future = executor.submit(self._translate_texts, texts, batch_size)
+                        in_flight.append((chunk, future))
                     
-                    chunk_end = min(chunk_start + chunk_size, len(feature_ids))
-                    chunk_ids = feature_ids[chunk_start:chunk_end]
+                    for chunk in islice(chunks, workers):
+                        submit(chunk)
                     
-                    # Process in small batches
-                    for i in range(0, len(chunk_ids), batch_size):
-                        if self.isCanceled():
+                    while in_flight:
+                        chunk, future = in_flight.popleft()
+                        if not self._wait_for(future):
                             self.layer.rollBack()
                             return False
                         
-                        batch_ids = chunk_ids[i:i + batch_size]
-                        batch_texts = [feature_map[fid]['text'] for fid in batch_ids]
+                        next_chunk = next(chunks, None)
+                        if next_chunk is not None:
+                            submit(next_chunk)
+                        chunk_ids = [fid for _, fids in chunk for fid in fids]
                         
                         try:
-                            # Translate batch
-                            translations = self.service.translate(
-                                texts=batch_texts,
-                                target_lang=self.target_lang,
-                                model=self.model,
-                                batch_mode=self.batch_mode,
-                                batch_size=len(batch_texts),
-                                prompt_template=self.prompt_template,
-                                source_lang=self.source_lang,
-                                instructions=self.instructions
-                            )
-                            
-                            # Update features
-                            for fid, translation in zip(batch_ids, translations):
-                                if translation:  # Only update if we got a translation
-                                    if self.layer.changeAttributeValue(fid, target_idx, translation):
-                                        feature_map[fid]['translated'] = True
-                                        self.translated_count += 1
-                                    else:
-                                        self.failed_features.append(fid)
-                                        QgsMessageLog.logMessage(
-                                            f"Failed to update feature {fid}",
-                                            'Clean Data',
-                                            Qgis.Warning
-                                        )
+                            translations = future.result()
                             
-                            # Report progress
-                            progress = (self.translated_count / self.total_features) * 100
-                            self.setProgress(progress)
+                            # Update every feature sharing each text, only where
+                            # we got a translation, as one edit command per chunk
+                            changes = {fid: translation
+                                       for (_, fids), translation in zip(chunk, translations)
+                                       if translation
+                                       for fid in fids}
+                            change_value = self.layer.changeAttributeValue
+                            failed = []
+                            self.layer.beginEditCommand("Translate values")
+                            for fid, translation in changes.items():
+                                if change_value(fid, target_idx, translation):
+                                    self.translated_count += 1
+                                else:
+                                    failed.append(fid)
+                            self.layer.endEditCommand()
                             
-                            # Call progress callback
-                            if self.callback:
-                                self.callback(self)
+                            # One warning per chunk rather than per feature
+                            if failed:
+                                self.failed_features.extend(failed)
+                                QgsMessageLog.logMessage(
+                                    f"Failed to update features: {', '.join(map(str, failed))}",
+                                    'Clean Data',
+                                    Qgis.Warning
+                                )
                             
+                            # Report progress, at most every PROGRESS_INTERVAL
+                            # seconds; finished() always reports the final state
+                            now = time.monotonic()
+                            if now - last_progress >= PROGRESS_INTERVAL:
+                                last_progress = now
+                                progress = (self.translated_count / self.total_features) * 100
+                                self.setProgress(progress)
+                                
+                                # Call progress callback
+                                if self.callback:
+                                    self.callback(self)
+                                
+                                if DEBUG:
+                                    QgsMessageLog.logMessage(
+                                        f"Translated {self.translated_count}/{self.total_features} features...",
+                                        'Clean Data',
+                                        Qgis.Info
+                                    )
+                        
                         except Exception as e:
                             QgsMessageLog.logMessage(
-                                f"Error processing batch: {str(e)}",
+                                f"Error processing chunk: {str(e)}",
                                 'Clean Data',
                                 Qgis.Warning
                             )
                             # Add failed features to list
-                            self.failed_features.extend(batch_ids)
+                            self.failed_features.extend(chunk_ids)
                             # Don't continue retrying if it's an auth error
                             if '403' in str(e):
                                 QgsMessageLog.logMessage(
@@ -655,26 +1189,30 @@ class TranslationTask(QgsTask):
                                 return False
                             continue
                         
-                        QgsMessageLog.logMessage(
-                            f"Translated {self.translated_count}/{self.total_features} features...",
-                            'Clean Data',
-                            Qgis.Info
-                        )
+                        # Commit each chunk so the edit buffer stays small and a
+                        # canceled or failed run keeps the chunks already done;
+                        # the next run only fetches the rows still empty
+                        if self.layer.isModified():
+                            if not self.layer.commitChanges() or not self.layer.startEditing():
+                                raise ValueError("Failed to commit changes to layer")
+                finally:
+                    # Queued chunks are dropped; running ones notice the
+                    # cancel between batches and finish in the background
+                    _shutdown_now(executor)
+                
+                self.setProgress((self.translated_count / self.total_features) * 100)
                 
                 # Verify results
-                untranslated = [
-                    fid for fid, data in feature_map.items() 
-                    if not data['translated']
-                ]
+                untranslated = self.total_features - self.translated_count
                 
                 if untranslated:
                     QgsMessageLog.logMessage(
-                        f"Warning: {len(untranslated)} features were not translated",
+                        f"Warning: {untranslated} features were not translated",
                         'Clean Data',
                         Qgis.Warning
                     )
                 
-                # Commit changes
+                # Commit anything left and stop editing
                 if not self.layer.commitChanges():
                     raise ValueError("Failed to commit changes to layer")
                 
@@ -701,6 +1239,32 @@ class TranslationTask(QgsTask):
             )
             return False
             
+    def _wait_for(self, future):
+        """Wait until a chunk is done; False if the task is canceled first"""
+        while not self.isCanceled():
+            try:
+                future.exception(timeout=CANCEL_POLL_INTERVAL)
+                return True
+            except FutureTimeoutError:
+                pass
+        return False
+        
+    def _translate_texts(self, texts, batch_size):
+        """Translate a chunk of texts with the task's service settings"""
+        if self.isCanceled():
+            return [None] * len(texts)
+        return self.service.translate(
+            is_canceled=self.isCanceled,
+            texts=texts,
+            target_lang=self.target_lang,
+            model=self.model,
+            batch_mode=self.batch_mode,
+            batch_size=batch_size,
+            prompt_template=self.prompt_template,
+            source_lang=self.source_lang,
+            instructions=self.instructions
+        )
+        
     def finished(self, result):
         """Called when the task is complete"""
         # Always call the callback one last time to ensure UI is updated
@@ -728,62 +1292,10 @@ class TranslationTask(QgsTask):
             )
         else:
             QgsMessageLog.logMessage(
-                "Translation was cancelled",
+                f"Translation was cancelled after {self.translated_count} features",
                 'Clean Data',
                 Qgis.Warning
             )
-            
-    def process_batch(self, texts, features, target_idx):
-        """Process a batch of texts"""
-        try:
-            # Translate the batch
-            translations = self.service.translate(
-                texts=texts,
-                target_lang=self.target_lang,
-                model=self.model,
-                batch_mode=self.batch_mode,
-                batch_size=len(texts),
-                prompt_template=self.prompt_template,
-                source_lang=self.source_lang,
-                instructions=self.instructions
-            )
-            
-            # Update features
-            for feat, trans in zip(features, translations):
-                if not self.layer.changeAttributeValue(feat.id(), target_idx, trans):
-                    QgsMessageLog.logMessage(
-                        f"Failed to update feature {feat.id()}",
-                        'Clean Data',
-                        Qgis.Warning
-                    )
-                self.translated_count += 1
-                
-            # Report progress
-            progress = (self.translated_count / self.total_features) * 100
-            self.setProgress(progress)
-            
-            # Call progress callback if provided
-            if self.callback:
-                self.callback(self)
-            
-            QgsMessageLog.logMessage(
-                f"Translated {self.translated_count}/{self.total_features} features...",
-                'Clean Data',
-                Qgis.Info
-            )
-            
-            return True
-            
-        except Exception as e:
-            self.exception = e
-            QgsMessageLog.logMessage(
-                f"Batch translation error: {str(e)}. Continuing with next batch...",
-                'Clean Data',
-                Qgis.Warning
-            )
-            # Add failed features to list
-            self.failed_features.extend([feat.id() for feat in features])
-            return False
 
 class TranslationManager:
     """Manager class for handling translations"""
@@ -791,15 +1303,39 @@ class TranslationManager:
     def __init__(self):
         self.task = None
         
+        # Services already set up, reused while their settings are unchanged:
+        # service class -> (settings, service)
+        self._services = {}
+        
     def get_service(self, service_name):
         """Get translation service instance based on name"""
         service_name = service_name.lower().replace(' ', '')
         if service_name in ['google', 'googletranslate']:
-            return GoogleTranslateService()
+            service_class = GoogleTranslateService
+            config = SettingsManager.get_google_api_key()
         elif service_name in ['ollama', 'ollamaapi']:
-            return OllamaService()
+            service_class = OllamaService
+            config = (SettingsManager.get_ollama_url(), SettingsManager.get_ollama_model())
         else:
             raise ValueError(f"Unknown translation service: {service_name}")
+        
+        # Skip the setup round-trip (key check, model listing) when the
+        # relevant settings haven't changed since the last call
+        cached = self._services.get(service_class)
+        if cached is not None and cached[0] == config:
+            return cached[1]
+        
+        service = service_class()
+        if cached is not None:
+            cached[1].close()
+        self._services[service_class] = (config, service)
+        return service
+        
+    def close(self):
+        """Close the pooled connections of every service set up so far"""
+        for _, service in self._services.values():
+            service.close()
+        self._services.clear()
             
     def translate_column(self, layer, source_field, target_field, prompt_template=None, 
                         service_name='Ollama', model=None, source_lang='auto', target_lang='ar', 
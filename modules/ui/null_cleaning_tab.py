@@ -229,7 +229,8 @@ class NullCleaningTab(QWidget):
             return
             
         # Check if field exists
-        if layer.fields().indexFromName(field) == -1:
+        field_idx = layer.fields().indexFromName(field)
+        if field_idx == -1:
             QMessageBox.warning(self, "Error", "Please select a valid field.")
             return
             
@@ -247,7 +248,7 @@ class NullCleaningTab(QWidget):
                     layer.startEditing()
                 
                 # Delete the field
-                if layer.deleteAttribute(layer.fields().indexFromName(field)):
+                if layer.deleteAttribute(field_idx):
                     layer.commitChanges()
                     
                     # Force layer to refresh its fields
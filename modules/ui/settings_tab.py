@@ -5,6 +5,8 @@ from qgis.PyQt.QtWidgets import (QWidget, QVBoxLayout, QGroupBox, QLabel,
                                 QLineEdit, QPushButton, QSpinBox, QMessageBox)
 from qgis.PyQt.QtCore import Qt
 
+from ..translation import OllamaService
+
 class SettingsTab(QWidget):
     """Settings tab widget"""
     
@@ -85,6 +87,18 @@ class SettingsTab(QWidget):
         self.batch_size.setMinimum(1)
         self.batch_size.setMaximum(100)
         self.batch_size.setValue(15)
+        self.batch_size.setToolTip(
+            f"Texts per request; Ollama batches are capped at {OllamaService.max_batch_size}"
+        )
+        
+        parallel_label = QLabel("Parallel Requests:")
+        self.ollama_parallel = QSpinBox()
+        self.ollama_parallel.setMinimum(1)
+        self.ollama_parallel.setMaximum(16)
+        self.ollama_parallel.setValue(4)
+        self.ollama_parallel.setToolTip(
+            "Most requests a translation sends to Ollama at the same time"
+        )
         
         ollama_layout.addWidget(url_label)
         ollama_layout.addWidget(self.ollama_url)
@@ -92,9 +106,26 @@ class SettingsTab(QWidget):
         ollama_layout.addWidget(self.ollama_model)
         ollama_layout.addWidget(batch_label)
         ollama_layout.addWidget(self.batch_size)
+        ollama_layout.addWidget(parallel_label)
+        ollama_layout.addWidget(self.ollama_parallel)
         ollama_group.setLayout(ollama_layout)
         layout.addWidget(ollama_group)
         
+        # Translation Cache Settings
+        cache_group = QGroupBox("Translation Cache Settings:")
+        cache_layout = QVBoxLayout()
+        
+        cache_days_label = QLabel("Keep Translations (days):")
+        self.cache_days = QSpinBox()
+        self.cache_days.setMinimum(1)
+        self.cache_days.setMaximum(3650)
+        self.cache_days.setValue(90)
+        
+        cache_layout.addWidget(cache_days_label)
+        cache_layout.addWidget(self.cache_days)
+        cache_group.setLayout(cache_layout)
+        layout.addWidget(cache_group)
+        
         # Save button
         self.save_btn = QPushButton("Save Settings")
         layout.addWidget(self.save_btn)
@@ -126,25 +157,34 @@ class SettingsTab(QWidget):
         self.ollama_url.setText(settings.get_ollama_url() or 'https://llmh.geomda.ai/')
         self.ollama_model.setText(settings.get_ollama_model() or 'aya')
         self.batch_size.setValue(settings.get_batch_size() or 15)
+        self.ollama_parallel.setValue(settings.get_ollama_parallel())
+        
+        # Translation Cache
+        self.cache_days.setValue(settings.get_translation_cache_days())
         
     def save_settings(self):
         """Save settings to QgsSettings"""
-        settings = self.dialog.settings_manager
-        
-        # Google Translate
-        settings.set_google_api_key(self.google_key.text())
-        
-        # OpenAI
-        settings.set_openai_api_key(self.openai_key.text())
-        settings.set_openai_model(self.openai_model.text())
-        
-        # DeepSeek
-        settings.set_deepseek_api_key(self.deepseek_key.text())
-        settings.set_deepseek_model(self.deepseek_model.text())
-        
-        # Ollama
-        settings.set_ollama_url(self.ollama_url.text())
-        settings.set_ollama_model(self.ollama_model.text())
-        settings.set_batch_size(self.batch_size.value())
+        # Save everything in one settings group write
+        self.dialog.settings_manager.set_many({
+            # Google Translate
+            'google_api_key': self.google_key.text(),
+            
+            # OpenAI
+            'openai_api_key': self.openai_key.text(),
+            'openai_model': self.openai_model.text(),
+            
+            # DeepSeek
+            'deepseek_api_key': self.deepseek_key.text(),
+            'deepseek_model': self.deepseek_model.text(),
+            
+            # Ollama
+            'ollama_url': self.ollama_url.text(),
+            'ollama_model': self.ollama_model.text(),
+            'batch_size': self.batch_size.value(),
+            'ollama_parallel': self.ollama_parallel.value(),
+            
+            # Translation Cache
+            'translation_cache_days': self.cache_days.value()
+        })
         
         QMessageBox.information(self, "Success", "Settings saved successfully!")
@@ -10,6 +10,7 @@ from qgis.PyQt.QtCore import Qt
 from qgis.core import QgsMessageLog, Qgis, QgsProject, QgsVectorLayer
 import re
 from ..settings_manager import SettingsManager  # Fixed import path
+from ..translation import GoogleTranslateService, OllamaService
 
 class TranslationTab(QWidget):
     """Translation tab widget"""
@@ -130,9 +131,13 @@ class TranslationTab(QWidget):
         # Batch size spinbox
         batch_layout.addWidget(QLabel("Batch Size:"))
         self.batch_size = QSpinBox()
-        self.batch_size.setRange(1, 100)
+        self.batch_size.setRange(1, GoogleTranslateService.max_batch_size)
         self.batch_size.setValue(10)
-        self.batch_size.setToolTip("Number of texts to translate at once in batch mode")
+        self.batch_size.setToolTip(
+            "Number of texts to translate at once in batch mode "
+            f"(at most {GoogleTranslateService.max_batch_size} for Google Translate "
+            f"and {OllamaService.max_batch_size} for Ollama)"
+        )
         batch_layout.addWidget(self.batch_size)
         
         trans_layout.addLayout(batch_layout)
@@ -338,11 +343,11 @@ class TranslationTab(QWidget):
                 f"Translation failed: {str(task.exception)}"
             )
         else:
-            if hasattr(task, 'skipped_features') and task.skipped_features:
+            if getattr(task, 'skipped_count', 0):
                 QMessageBox.information(
                     self,
                     "Success",
-                    f"Translation completed successfully!\n\nSkipped {len(task.skipped_features)} features that were empty or already translated."
+                    f"Translation completed successfully!\n\nSkipped {task.skipped_count} features that were empty or already translated."
                 )
             else:
                 QMessageBox.information(
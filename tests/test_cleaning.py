@@ -0,0 +1,113 @@
+"""
+Tests for the cleaning module of the Clean Data QGIS plugin.
+Run from the plugin directory with a Python that has the QGIS bindings.
+"""
+
+import unittest
+
+try:
+    from modules import cleaning
+except ImportError:
+    cleaning = None
+
+
+@unittest.skipIf(cleaning is None, "QGIS Python bindings are not available")
+class NullThresholdTest(unittest.TestCase):
+    """Null count needed to reach a percentage threshold"""
+
+    def test_exact_boundary(self):
+        # 7 nulls out of 100 features is exactly 7%
+        self.assertEqual(cleaning._nulls_needed(7, 100), 7)
+        self.assertEqual(cleaning._nulls_needed(7.0, 100), 7)
+
+    def test_rounds_up(self):
+        self.assertEqual(cleaning._nulls_needed(7.5, 100), 8)
+        self.assertEqual(cleaning._nulls_needed(50, 3), 2)
+
+    def test_decimal_boundary(self):
+        # Float thresholds from the UI must not round past the exact count
+        for threshold, needed in ((16.1, 161), (32.2, 322), (32.7, 327),
+                                  (64.4, 644), (64.9, 649), (65.4, 654)):
+            self.assertEqual(cleaning._nulls_needed(threshold, 1000), needed)
+        self.assertEqual(cleaning._nulls_needed(16.15, 1000), 162)
+        
+    def test_limits(self):
+        self.assertEqual(cleaning._nulls_needed(0, 100), 0)
+        self.assertEqual(cleaning._nulls_needed(100, 100), 100)
+
+
+
+class _Field:
+    def __init__(self, name):
+        self._name = name
+        
+    def name(self):
+        return self._name
+
+
+class _Feature:
+    def __init__(self, fid, value):
+        self._fid = fid
+        self._value = value
+        
+    def id(self):
+        return self._fid
+        
+    def attributes(self):
+        return [self._value]
+
+
+class _FakeLayer:
+    """Single text field layer recording the values written to it"""
+    
+    def __init__(self, values):
+        self._features = [_Feature(fid, value) for fid, value in enumerate(values)]
+        self.changes = {}
+        
+    def fields(self):
+        return [_Field('code')]
+        
+    def getFeatures(self, request=None):
+        return iter(self._features)
+        
+    def beginEditCommand(self, text):
+        pass
+        
+    def endEditCommand(self):
+        pass
+        
+    def changeAttributeValue(self, fid, idx, value):
+        self.changes[fid] = value
+        return True
+
+
+@unittest.skipIf(cleaning is None, "QGIS Python bindings are not available")
+class FindValuesTest(unittest.TestCase):
+    """Plain find_values replacement"""
+    
+    def replace(self, values, **kwargs):
+        layer = _FakeLayer(values)
+        count = cleaning.ValueCleaner.find_and_replace_values(
+            layer, 'code', assume_editing=True, **kwargs)
+        return count, layer.changes
+        
+    def test_pattern_match_outside_find_values_is_untouched(self):
+        count, changes = self.replace(['AB-12', 'AB-34', 'XY-99'], pattern_match=True,
+                                      custom_pattern=r'\d+', find_values=['12'],
+                                      replace_value='twelve')
+        self.assertEqual(count, 1)
+        self.assertEqual(changes, {0: 'twelve'})
+        
+    def test_blank_replacement_only_for_found_values(self):
+        count, changes = self.replace(['AB-12', 'AB-34'], pattern_match=True,
+                                      custom_pattern=r'\d+', find_values=['12'],
+                                      replace_value='')
+        self.assertEqual(changes, {0: ''})
+        
+    def test_find_values_requires_replacement(self):
+        with self.assertRaises(ValueError):
+            self.replace(['a'], find_values=['a'])
+
+
+if __name__ == '__main__':
+    unittest.main()